@@ -1,7 +1,7 @@
+from magpylib._src.defaults.defaults_utility import ALLOWED_BACKENDS
 from magpylib._src.defaults.defaults_utility import color_validator
 from magpylib._src.defaults.defaults_utility import get_defaults_dict
 from magpylib._src.defaults.defaults_utility import MagicProperties
-from magpylib._src.defaults.defaults_utility import SUPPORTED_PLOTTING_BACKENDS
 from magpylib._src.defaults.defaults_utility import validate_property_class
 from magpylib._src.style import DisplayStyle
 
@@ -87,10 +87,9 @@ class Display(MagicProperties):
 
     @backend.setter
     def backend(self, val):
-        backends = [*SUPPORTED_PLOTTING_BACKENDS, "auto"]
-        assert val is None or val in backends, (
+        assert val is None or val in ALLOWED_BACKENDS, (
             f"the `backend` property of {type(self).__name__} must be one of"
-            f"{backends}"
+            f"{ALLOWED_BACKENDS}"
             f" but received {repr(val)} instead"
         )
         self._backend = val
@@ -112,8 +111,7 @@ class Display(MagicProperties):
             name = type(self).__name__
             try:
                 val = tuple(
-                    color_validator(c, allow_None=False, parent_name=f"{name}")
-                    for c in val
+                    color_validator(c, allow_None=False, parent_name=name) for c in val
                 )
             except TypeError as err:
                 raise ValueError(
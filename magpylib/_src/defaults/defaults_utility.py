@@ -1,5 +1,6 @@
 """utilities for creating property classes"""
 import collections.abc
+import re
 from copy import deepcopy
 from functools import lru_cache
 
@@ -7,6 +8,8 @@ from magpylib._src.defaults.defaults_values import DEFAULTS
 
 SUPPORTED_PLOTTING_BACKENDS = ("matplotlib", "plotly", "pyvista")
 
+ALLOWED_BACKENDS = (*SUPPORTED_PLOTTING_BACKENDS, "auto")
+
 
 ALLOWED_SYMBOLS = (".", "+", "D", "d", "s", "x", "o")
 
@@ -25,6 +28,8 @@ ALLOWED_LINESTYLES = (
     (0, (1, 1)),
 )
 
+RE_HEX_COLOR = re.compile(r"#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})")
+
 COLORS_SHORT_TO_LONG = {
     "r": "red",
     "g": "green",
@@ -70,11 +75,12 @@ def get_defaults_dict(arg=None) -> dict:
         default sub dict
     """
 
-    dict_ = deepcopy(DEFAULTS)
+    dict_ = DEFAULTS
     if arg is not None:
         for v in arg.split("."):
             dict_ = dict_[v]
-    return dict_
+    # only copy the requested sub dict
+    return deepcopy(dict_)
 
 
 def update_nested_dict(d, u, same_keys_only=False, replace_None_only=False) -> dict:
@@ -198,7 +204,6 @@ def linearize_dict(kwargs, separator=".") -> dict:
     return dict_
 
 
-@lru_cache(maxsize=1000)
 def color_validator(color_input, allow_None=True, parent_name=""):
     """validates color inputs based on chosen `backend', allows `None` by default.
 
@@ -221,11 +226,18 @@ def color_validator(color_input, allow_None=True, parent_name=""):
     ValueError
         raises ValueError inf validation fails
     """
+    if isinstance(color_input, list):
+        # make input hashable for the cached validation
+        color_input = tuple(color_input)
+    return _color_validator(color_input, allow_None, parent_name)
+
+
+@lru_cache(maxsize=1000)
+def _color_validator(color_input, allow_None, parent_name):
+    """cached color validation, see `color_validator`"""
     color_input_original = color_input
     if not allow_None or color_input is not None:
-        # pylint: disable=import-outside-toplevel
         color_input = COLORS_SHORT_TO_LONG.get(color_input, color_input)
-        import re
 
         hex_fail = True
         # pylint: disable=W0702
@@ -265,9 +277,9 @@ def color_validator(color_input, allow_None=True, parent_name=""):
                     color_input = f"#{c[0]:02x}{c[1]:02x}{c[2]:02x}"
                 except:
                     pass
-            re_hex = re.compile(r"#([A-Fa-f0-9]{6}|[A-Fa-f0-9]{3})")
-            hex_fail = not re_hex.fullmatch(color_input)
+            hex_fail = not RE_HEX_COLOR.fullmatch(color_input)
 
+        # pylint: disable=import-outside-toplevel
         from matplotlib.colors import CSS4_COLORS as mcolors
 
         if hex_fail and str(color_input) not in mcolors:
@@ -287,6 +299,8 @@ def color_validator(color_input, allow_None=True, parent_name=""):
 
 def validate_property_class(val, name, class_, parent):
     """validator for sub property"""
+    if isinstance(val, class_):
+        return val
     if isinstance(val, dict):
         val = class_(**val)
     elif val is None:
@@ -303,7 +317,8 @@ def validate_property_class(val, name, class_, parent):
 def validate_style_keys(style_kwargs):
     """validates style kwargs based on key up to first underscore.
     checks in the defaults structures the generally available style keys"""
-    styles_by_family = get_defaults_dict("display.style")
+    # the defaults are only read here, no need for a copy
+    styles_by_family = DEFAULTS["display"]["style"]
     valid_keys = {key for v in styles_by_family.values() for key in v}
     level0_style_keys = {k.split("_")[0]: k for k in style_kwargs}
     kwargs_diff = set(level0_style_keys).difference(valid_keys)
@@ -328,6 +343,14 @@ class MagicProperties:
     """ """"""
 
     __isfrozen = False
+    _property_names = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # properties are defined at class creation, collect their names once per class
+        cls._property_names = tuple(
+            attr for attr in dir(cls) if isinstance(getattr(cls, attr, None), property)
+        )
 
     def __init__(self, **kwargs):
         input_dict = {k: None for k in self._property_names_generator()}
@@ -345,7 +368,13 @@ class MagicProperties:
         self._freeze()
 
     def __setattr__(self, key, value):
-        if self.__isfrozen and not hasattr(self, key):
+        # instance attributes and class-level descriptors are looked up directly, which avoids
+        # calling the property getter as `hasattr(self, key)` would do
+        if (
+            self.__isfrozen
+            and key not in self.__dict__
+            and not hasattr(type(self), key)
+        ):
             raise AttributeError(
                 f"{type(self).__name__} has no property '{key}'"
                 f"\n Available properties are: {list(self._property_names_generator())}"
@@ -357,11 +386,7 @@ class MagicProperties:
 
     def _property_names_generator(self):
         """returns a generator with class properties only"""
-        return (
-            attr
-            for attr in dir(self)
-            if isinstance(getattr(type(self), attr, None), property)
-        )
+        return iter(self._property_names)
 
     def __repr__(self):
         params = self._property_names_generator()
@@ -395,7 +420,12 @@ class MagicProperties:
         return dict_
 
     def update(
-        self, arg=None, _match_properties=True, _replace_None_only=False, **kwargs
+        self,
+        arg=None,
+        _match_properties=True,
+        _replace_None_only=False,
+        _skip_validation=False,
+        **kwargs,
     ):
         """
         Updates the class properties with provided arguments, supports magic underscore notation
@@ -412,6 +442,10 @@ class MagicProperties:
         _replace_None_only:
             updates matching properties that are equal to `None` (not already been set)
 
+        _skip_validation:
+            If `True`, values are stored without going through the property setters. Only use
+            with values that come from already validated objects (e.g. the default styles).
+
 
         Returns
         -------
@@ -422,17 +456,62 @@ class MagicProperties:
         if kwargs:
             arg.update(kwargs)
         arg = magic_to_dict(arg)
-        current_dict = self.as_dict()
+        # only properties present in `arg` can change, the others are left untouched
+        current_dict = {}
+        for k in arg:
+            if k in self._property_names:
+                val = getattr(self, k)
+                current_dict[k] = val.as_dict() if hasattr(val, "as_dict") else val
+        old_dict = current_dict.copy()
         new_dict = update_nested_dict(
             current_dict,
             arg,
             same_keys_only=not _match_properties,
             replace_None_only=_replace_None_only,
         )
-        for k, v in new_dict.items():
-            setattr(self, k, v)
+        # skip unchanged scalar values to avoid running their validators again
+        new_dict = {
+            k: v
+            for k, v in new_dict.items()
+            if not (
+                isinstance(v, (str, int, float, type(None)))
+                and k in old_dict
+                and type(v) is type(old_dict[k])
+                and v == old_dict[k]
+            )
+        }
+        if _skip_validation:
+            self._update_unchecked(new_dict)
+        else:
+            for k, v in new_dict.items():
+                setattr(self, k, v)
         return self
 
+    def _update_unchecked(self, dict_):
+        """stores values of a nested dictionary recursively, bypassing the property setters.
+        Properties without a private storage attribute (e.g. deprecated aliases) still go
+        through their setter."""
+        # pylint: disable=protected-access
+        for k, v in dict_.items():
+            attr = f"_{k}"
+            if attr not in self.__dict__:
+                setattr(self, k, v)
+                continue
+            current = self.__dict__[attr]
+            if isinstance(v, dict) and isinstance(current, MagicProperties):
+                current._update_unchecked(v)
+            else:
+                object.__setattr__(self, attr, v)
+
     def copy(self):
         """returns a copy of the current class instance"""
-        return deepcopy(self)
+        # sub-properties are copied recursively, which avoids going through the generic
+        # `deepcopy` machinery for each nested object
+        new = object.__new__(type(self))
+        for k, v in self.__dict__.items():
+            if isinstance(v, MagicProperties):
+                v = v.copy()
+            elif not isinstance(v, (str, int, float, type(None))):
+                v = deepcopy(v)
+            new.__dict__[k] = v
+        return new
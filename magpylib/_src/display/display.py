@@ -1,6 +1,7 @@
 """ Display function codes"""
 import warnings
 from contextlib import contextmanager
+from functools import lru_cache
 from importlib import import_module
 
 from matplotlib.axes import Axes as mplAxes
@@ -19,6 +20,13 @@ from magpylib._src.utility import test_path_format
 
 disp_args = get_defaults_dict("display").keys()
 
+# fallback kwargs applied when a backend does not support a feature
+FALLBACK_PARAMS = {
+    "animation": {"animation": False},
+    "subplots": {"row": None, "col": None},
+    "animation_output": {"animation_output": None},
+}
+
 
 class RegisteredBackend:
     """Base class for display backends"""
@@ -43,6 +51,11 @@ class RegisteredBackend:
             "colorgradient": supports_colorgradient,
             "animation_output": supports_animation_output,
         }
+        self._fallback_params = {
+            feat: params
+            for feat, params in FALLBACK_PARAMS.items()
+            if not self.supports[feat]
+        }
         self._register_backend(name)
 
     def _register_backend(self, name):
@@ -61,15 +74,10 @@ class RegisteredBackend:
         **kwargs,
     ):
         """Display function of the current backend"""
+        # pylint: disable=protected-access
         self = cls.backends[backend]
-        fallback = {
-            "animation": {"animation": False},
-            "subplots": {"row": None, "col": None},
-            "animation_output": {"animation_output": None},
-        }
-        for name, params in fallback.items():
-            condition = not all(kwargs.get(k, v) == v for k, v in params.items())
-            if condition and not self.supports[name]:
+        for name, params in self._fallback_params.items():
+            if not all(kwargs.get(k, v) == v for k, v in params.items()):
                 supported = [k for k, v in self.backends.items() if v.supports[name]]
                 supported_str = (
                     f"one of {supported!r}"
@@ -135,7 +143,14 @@ class RegisteredBackend:
 def get_show_func(backend):
     """Return the backend show function"""
     # defer import to show call. Importerror should only fail if unavalaible backend is called
-    return lambda: getattr(
+    return lambda: load_show_func(backend)
+
+
+@lru_cache(maxsize=None)
+def load_show_func(backend):
+    """Import and return the backend show function. The result is cached so that the
+    import machinery is only involved on the first call per backend."""
+    return getattr(
         import_module(f"magpylib._src.display.backend_{backend}"), f"display_{backend}"
     )
 
@@ -143,6 +158,17 @@ def get_show_func(backend):
 ROW_COL_SPECIFIC_NAMES = ("row", "col", "output", "sumup", "pixel_agg")
 
 
+def split_row_col_kwargs(kwargs):
+    """Split kwargs into row/col specific kwargs and remaining kwargs in a single pass"""
+    rco, other = {}, {}
+    for k, v in kwargs.items():
+        if k in ROW_COL_SPECIFIC_NAMES:
+            rco[k] = v
+        else:
+            other[k] = v
+    return rco, other
+
+
 def infer_backend(canvas):
     """Infers the plotting backend from canvas and environment"""
     # pylint: disable=import-outside-toplevel
@@ -190,10 +216,10 @@ def _show(
     """
 
     # process input objs
+    rco, kwargs = split_row_col_kwargs(kwargs)
     objects, obj_list_flat, max_rows, max_cols, subplot_specs = process_show_input_objs(
-        objects, **{k: v for k, v in kwargs.items() if k in ROW_COL_SPECIFIC_NAMES}
+        objects, **rco
     )
-    kwargs = {k: v for k, v in kwargs.items() if k not in ROW_COL_SPECIFIC_NAMES}
     kwargs["max_rows"], kwargs["max_cols"] = max_rows, max_cols
     kwargs["subplot_specs"] = subplot_specs
 
@@ -204,16 +230,15 @@ def _show(
     backend = check_format_input_backend(backend)
     check_input_zoom(zoom)
     check_input_animation(animation)
-    check_format_input_vector(
-        markers,
-        dims=(2,),
-        shape_m1=3,
-        sig_name="markers",
-        sig_type="array_like of shape (n,3)",
-        allow_None=True,
-    )
-
-    if markers:
+    if markers is not None:
+        markers = check_format_input_vector(
+            markers,
+            dims=(2,),
+            shape_m1=3,
+            sig_name="markers",
+            sig_type="array_like of shape (n,3)",
+            allow_None=False,
+        )
         objects = [
             *objects,
             {
@@ -400,13 +425,12 @@ def show(
         }
     )
     if ctx.isrunning:
-        rco = {k: v for k, v in kwargs.items() if k in ROW_COL_SPECIFIC_NAMES}
-        ctx.kwargs.update(
-            {k: v for k, v in kwargs.items() if k not in ROW_COL_SPECIFIC_NAMES}
-        )
-        ctx_objects = tuple({**o, **rco} for o in ctx.objects_from_ctx)
-        objects, *_ = process_show_input_objs(ctx_objects + objects, **rco)
-        ctx.objects += tuple(objects)
+        rco, other_kwargs = split_row_col_kwargs(kwargs)
+        if other_kwargs:
+            ctx.kwargs.update(other_kwargs)
+        # row/col kwargs are merged into fresh copies by `process_show_input_objs`
+        objects, *_ = process_show_input_objs([*ctx.objects_from_ctx, *objects], **rco)
+        ctx.objects.extend(objects)
         return None
     return _show(*objects, **kwargs)
 
@@ -445,12 +469,11 @@ def show_context(
     )
     try:
         ctx.isrunning = True
-        rco = {k: v for k, v in kwargs.items() if k in ROW_COL_SPECIFIC_NAMES}
+        rco, other_kwargs = split_row_col_kwargs(kwargs)
         objects, *_ = process_show_input_objs(objects, **rco)
-        ctx.objects_from_ctx += tuple(objects)
-        ctx.kwargs.update(
-            {k: v for k, v in kwargs.items() if k not in ROW_COL_SPECIFIC_NAMES}
-        )
+        ctx.objects_from_ctx.extend(objects)
+        if other_kwargs:
+            ctx.kwargs.update(other_kwargs)
         yield ctx
         ctx.show_return_value = _show(*ctx.objects, **ctx.kwargs)
     finally:
@@ -464,16 +487,16 @@ class DisplayContext:
 
     def __init__(self, isrunning=False):
         self.isrunning = isrunning
-        self.objects = ()
-        self.objects_from_ctx = ()
+        self.objects = []
+        self.objects_from_ctx = []
         self.kwargs = {}
         self.show_return_value = None
 
     def reset(self, reset_show_return_value=True):
         """Reset display context"""
         self.isrunning = False
-        self.objects = ()
-        self.objects_from_ctx = ()
+        self.objects = []
+        self.objects_from_ctx = []
         self.kwargs = {}
         if reset_show_return_value:
             self.show_return_value = None
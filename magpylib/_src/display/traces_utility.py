@@ -239,9 +239,14 @@ def get_flatten_objects_properties(*objs, colorsequence, **kwargs):
     """Return flat dict with objs as keys object properties as values.
     Properties include: row_cols, style, legendgroup, legendtext"""
     flat_objs = {}
+    # default styles do not change during the call, flatten them once per object type
+    defaults_cache = {}
     for obj in objs:
         flat_sub_objs = get_flatten_objects_properties_recursive(
-            *obj["objects"], colorsequence=colorsequence, **kwargs
+            *obj["objects"],
+            colorsequence=colorsequence,
+            defaults_cache=defaults_cache,
+            **kwargs,
         )
         for subobj, props in flat_sub_objs.items():
             if subobj in flat_objs:
@@ -262,15 +267,18 @@ def get_flatten_objects_properties_recursive(
     parent_color=None,
     parent_label=None,
     parent_showlegend=None,
+    defaults_cache=None,
     **kwargs,
 ):
     """returns a flat dict -> (obj: display_props, ...) from nested collections"""
     if color_cycle is None:
         color_cycle = cycle(colorsequence)
+    if defaults_cache is None:
+        defaults_cache = {}
     flat_objs = {}
     for subobj in obj_list_semi_flat:
         isCollection = getattr(subobj, "children", None) is not None
-        style = get_style(subobj, Config, **kwargs)
+        style = get_style(subobj, Config, defaults_cache=defaults_cache, **kwargs)
         if style.label is None:
             style.label = str(type(subobj).__name__)
         if parent_legendgroup is not None:
@@ -298,6 +306,7 @@ def get_flatten_objects_properties_recursive(
                     parent_color=style.color,
                     parent_label=label,
                     parent_showlegend=style.legend.show,
+                    defaults_cache=defaults_cache,
                     **kwargs,
                 )
             )
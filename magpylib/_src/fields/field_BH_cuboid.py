@@ -182,37 +182,42 @@ def magnet_cuboid_field(
                 (-zmc + mmm) * (-zmc + ppm) * (-zpc + pmp) * (-zpc + mpp)
             ) - np.log((-zmc + pmm) * (zmc - mpm) * (-zpc + mmp) * (zpc - ppp))
 
+        # products appearing several times in the arctan2 arguments
+        ymb_zmc, ypb_zmc, ymb_zpc, ypb_zpc = ymb * zmc, ypb * zmc, ymb * zpc, ypb * zpc
+        xma_zmc, xpa_zmc, xma_zpc, xpa_zpc = xma * zmc, xpa * zmc, xma * zpc, xpa * zpc
+        xma_ymb, xpa_ymb, xma_ypb, xpa_ypb = xma * ymb, xpa * ymb, xma * ypb, xpa * ypb
+
         ff1x = (
-            np.arctan2((ymb * zmc), (xma * mmm))
-            - np.arctan2((ymb * zmc), (xpa * pmm))
-            - np.arctan2((ypb * zmc), (xma * mpm))
-            + np.arctan2((ypb * zmc), (xpa * ppm))
-            - np.arctan2((ymb * zpc), (xma * mmp))
-            + np.arctan2((ymb * zpc), (xpa * pmp))
-            + np.arctan2((ypb * zpc), (xma * mpp))
-            - np.arctan2((ypb * zpc), (xpa * ppp))
+            np.arctan2(ymb_zmc, (xma * mmm))
+            - np.arctan2(ymb_zmc, (xpa * pmm))
+            - np.arctan2(ypb_zmc, (xma * mpm))
+            + np.arctan2(ypb_zmc, (xpa * ppm))
+            - np.arctan2(ymb_zpc, (xma * mmp))
+            + np.arctan2(ymb_zpc, (xpa * pmp))
+            + np.arctan2(ypb_zpc, (xma * mpp))
+            - np.arctan2(ypb_zpc, (xpa * ppp))
         )
 
         ff1y = (
-            np.arctan2((xma * zmc), (ymb * mmm))
-            - np.arctan2((xpa * zmc), (ymb * pmm))
-            - np.arctan2((xma * zmc), (ypb * mpm))
-            + np.arctan2((xpa * zmc), (ypb * ppm))
-            - np.arctan2((xma * zpc), (ymb * mmp))
-            + np.arctan2((xpa * zpc), (ymb * pmp))
-            + np.arctan2((xma * zpc), (ypb * mpp))
-            - np.arctan2((xpa * zpc), (ypb * ppp))
+            np.arctan2(xma_zmc, (ymb * mmm))
+            - np.arctan2(xpa_zmc, (ymb * pmm))
+            - np.arctan2(xma_zmc, (ypb * mpm))
+            + np.arctan2(xpa_zmc, (ypb * ppm))
+            - np.arctan2(xma_zpc, (ymb * mmp))
+            + np.arctan2(xpa_zpc, (ymb * pmp))
+            + np.arctan2(xma_zpc, (ypb * mpp))
+            - np.arctan2(xpa_zpc, (ypb * ppp))
         )
 
         ff1z = (
-            np.arctan2((xma * ymb), (zmc * mmm))
-            - np.arctan2((xpa * ymb), (zmc * pmm))
-            - np.arctan2((xma * ypb), (zmc * mpm))
-            + np.arctan2((xpa * ypb), (zmc * ppm))
-            - np.arctan2((xma * ymb), (zpc * mmp))
-            + np.arctan2((xpa * ymb), (zpc * pmp))
-            + np.arctan2((xma * ypb), (zpc * mpp))
-            - np.arctan2((xpa * ypb), (zpc * ppp))
+            np.arctan2(xma_ymb, (zmc * mmm))
+            - np.arctan2(xpa_ymb, (zmc * pmm))
+            - np.arctan2(xma_ypb, (zmc * mpm))
+            + np.arctan2(xpa_ypb, (zmc * ppm))
+            - np.arctan2(xma_ymb, (zpc * mmp))
+            + np.arctan2(xpa_ymb, (zpc * pmp))
+            + np.arctan2(xma_ypb, (zpc * mpp))
+            - np.arctan2(xpa_ypb, (zpc * ppp))
         )
 
         # contributions from x-magnetization
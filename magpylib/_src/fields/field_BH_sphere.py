@@ -63,7 +63,7 @@ def magnet_sphere_field(
 
     # all special cases r0=0 and mag=0 automatically covered
 
-    x, y, z = np.copy(observers.T)
+    x, y, z = observers.T
     r = np.sqrt(x**2 + y**2 + z**2)  # faster than np.linalg.norm
     r0 = abs(diameter) / 2
 
@@ -56,7 +56,6 @@ from magpylib._src.input_checks import check_excitations
 from magpylib._src.input_checks import check_format_input_observers
 from magpylib._src.input_checks import check_format_pixel_agg
 from magpylib._src.input_checks import check_getBH_output_type
-from magpylib._src.utility import check_static_sensor_orient
 from magpylib._src.utility import format_obj_input
 from magpylib._src.utility import format_src_inputs
 from magpylib._src.utility import get_registered_sources
@@ -72,29 +71,51 @@ def tile_group_property(group: list, n_pp: int, prop_name: str):
     return np.repeat(out, n_pp, axis=0)
 
 
-def get_src_dict(group: list, n_pix: int, n_pp: int, poso: np.ndarray) -> dict:
+def pad_path(path: np.ndarray, path_len: int) -> np.ndarray:
+    """fill up path array of shape (m,x) to path_len with the last path entry"""
+    m_tile = path_len - len(path)
+    if m_tile > 0:
+        if len(path) == 1:
+            return np.broadcast_to(path, (path_len, path.shape[1]))
+        return np.pad(path, ((0, m_tile), (0, 0)), mode="edge")
+    return path
+
+
+def get_padded_path(obj, path_len: int) -> tuple:
+    """return position and orientation (quaternion) path of obj, filled up to
+    path_len with the last path entry (static path). The object is not modified."""
+    # pylint: disable=protected-access
+    pos = pad_path(obj._position, path_len)
+    quat = pad_path(obj._orientation.as_quat(), path_len)
+    return pos, quat
+
+
+def get_src_dict(
+    group: list, n_pix: int, n_pp: int, poso: np.ndarray, path_len: int
+) -> dict:
     """create dictionaries for level1 input"""
     # pylint: disable=protected-access
     # pylint: disable=too-many-return-statements
 
     # tile up basic attributes that all sources have
+    paths = [get_padded_path(src, path_len) for src in group]
+
     # position
-    poss = np.array([src._position for src in group])
-    posv = np.tile(poss, n_pix).reshape((-1, 3))
+    poss = np.concatenate([pos for pos, _ in paths])
+    posv = np.repeat(poss, n_pix, axis=0)
 
     # orientation
-    rots = np.array([src._orientation.as_quat() for src in group])
-    rotv = np.tile(rots, n_pix).reshape((-1, 4))
+    rots = np.concatenate([quat for _, quat in paths])
+    rotv = np.repeat(rots, n_pix, axis=0)
     rotobj = R.from_quat(rotv)
 
-    # pos_obs
-    posov = np.tile(poso, (len(group), 1))
+    # pos_obs are passed once for the whole group and broadcasted in level1
 
     # determine which group we are dealing with and tile up properties
 
     kwargs = {
         "position": posv,
-        "observers": posov,
+        "observers": poso,
         "orientation": rotobj,
     }
 
@@ -128,6 +149,8 @@ def getBH_level1(
     Args
     ----
     kwargs: dict of shape (N,x) input vectors that describes the computation.
+        observers can also be of shape (n,3) with N=l*n, in which case they are
+        used for each of the l blocks of n input vectors.
 
     Returns
     -------
@@ -135,15 +158,20 @@ def getBH_level1(
 
     """
 
+    # rotation matrices are computed only once and used for both directions
+    #   (the inverse of a rotation matrix is its transpose)
+    rotm = orientation.as_matrix()
+
     # transform obs_pos into source CS
-    pos_rel_rot = orientation.apply(observers - position, inverse=True)
+    pos_rel = observers - position.reshape(-1, *observers.shape)
+    pos_rel_rot = np.einsum("...ji,...j->...i", rotm, pos_rel.reshape(-1, 3))
 
     # compute field
     BH = field_func(field=field, observers=pos_rel_rot, **kwargs)
 
     # transform field back into global CS
     if BH is not None:  # catch non-implemented field_func a level above
-        BH = orientation.apply(BH)
+        BH = np.einsum("...ij,...j->...i", rotm, BH)
 
     return BH
 
@@ -184,7 +212,7 @@ def getBH_level2(
     Info:
     -----
     - generates a 1D list of sources (collections flattened) and a 1D list of sensors from input
-    - tile all paths of static (path_length=1) objects
+    - fill up paths of static (path_length=1) objects
     - combine all sensor pixel positions for joint evaluation
     - group similar source types for joint evaluation
     - compute field and store in allocated array
@@ -253,18 +281,18 @@ def getBH_level2(
     pix_inds = np.cumsum([0] + pix_nums)  # cumulative indices of pixel for each sensor
     pix_all_same = len(set(pix_shapes)) == 1
 
+    # sensor orientations as quaternions, computed only once
+    sens_quats = [sens._orientation.as_quat() for sens in sensors]
+
     # check which sensors have unit rotation
     #   so that they dont have to be rotated back later (performance issue)
-    #   this check is made now when sensor paths are not yet tiled.
     unitQ = np.array([0, 0, 0, 1.0])
-    unrotated_sensors = [
-        all(all(r == unitQ) for r in sens._orientation.as_quat()) for sens in sensors
-    ]
+    unrotated_sensors = [np.all(q == unitQ) for q in sens_quats]
 
     # check which sensors have a static orientation
     #   either static sensor or translation path
     #   later such sensors require less back-rotation effort (performance issue)
-    static_sensor_rot = check_static_sensor_orient(sensors)
+    static_sensor_rot = [np.all(q == q[0]) for q in sens_quats]
 
     # some important quantities -------------------------------------------------
     obj_list = set(src_list + sensors)  # unique obj entries only !!!
@@ -272,40 +300,25 @@ def getBH_level2(
     num_of_src_list = len(src_list)
     num_of_sensors = len(sensors)
 
-    # tile up paths -------------------------------------------------------------
+    # path length ---------------------------------------------------------------
     #   all obj paths that are shorter than max-length are filled up with the last
-    #   position/orientation of the object (static paths)
-    path_lengths = [len(obj._position) for obj in obj_list]
-    max_path_len = max(path_lengths)
-
-    # objects to tile up and reset below
-    mask_reset = [max_path_len != pl for pl in path_lengths]
-    reset_obj = [obj for obj, mask in zip(obj_list, mask_reset) if mask]
-    reset_obj_m0 = [pl for pl, mask in zip(path_lengths, mask_reset) if mask]
-
-    if max_path_len > 1:
-        for obj, m0 in zip(reset_obj, reset_obj_m0):
-            # length to be tiled
-            m_tile = max_path_len - m0
-            # tile up position
-            tile_pos = np.tile(obj._position[-1], (m_tile, 1))
-            obj._position = np.concatenate((obj._position, tile_pos))
-            # tile up orientation
-            tile_orient = np.tile(obj._orientation.as_quat()[-1], (m_tile, 1))
-            # FUTURE use Rotation.concatenate() requires scipy>=1.8 and python 3.8
-            tile_orient = np.concatenate((obj._orientation.as_quat(), tile_orient))
-            obj._orientation = R.from_quat(tile_orient)
+    #   position/orientation of the object (static paths) when the input vectors
+    #   are generated, without modifying the objects themselves
+    max_path_len = max(len(obj._position) for obj in obj_list)
 
     # combine information form all sensors to generate pos_obs with-------------
     #   shape (m * concat all sens flat pixel, 3)
     #   allows sensors with different pixel shapes <- relevant?
-    poso = [
-        [
-            r.apply(sens.pixel.reshape(-1, 3)) + p
-            for r, p in zip(sens._orientation, sens._position)
-        ]
-        for sens in sensors
+    sens_paths = [
+        (pad_path(sens._position, max_path_len), pad_path(q, max_path_len))
+        for sens, q in zip(sensors, sens_quats)
     ]
+    poso = []
+    for sens, (pos, q), unrot in zip(sensors, sens_paths, unrotated_sensors):
+        pix = sens._pixel_flat
+        if not unrot:  # rotate pixel for all path indices at once, shape (m,n,3)
+            pix = np.einsum("mij,nj->mni", R.from_quat(q).as_matrix(), pix)
+        poso.append(pix + pos[:, np.newaxis])
     poso = np.concatenate(poso, axis=1).reshape(-1, 3)
     n_pp = len(poso)
     n_pix = int(n_pp / max_path_len)
@@ -332,7 +345,8 @@ def getBH_level2(
     for field_func, group in field_func_groups.items():
         lg = len(group["sources"])
         gr = group["sources"]
-        src_dict = get_src_dict(gr, n_pix, n_pp, poso)  # compute array dict for level1
+        # compute array dict for level1
+        src_dict = get_src_dict(gr, n_pix, n_pp, poso, max_path_len)
         B_group = getBH_level1(
             field_func=field_func, field=field, **src_dict
         )  # compute field
@@ -344,46 +358,38 @@ def getBH_level2(
         B_group = B_group.reshape(
             (lg, max_path_len, n_pix, 3)
         )  # reshape (2% slower for large arrays)
-        for gr_ind in range(lg):  # put into dedicated positions in B
-            B[group["order"][gr_ind]] = B_group[gr_ind]
+        B[group["order"]] = B_group  # put into dedicated positions in B
 
     # reshape output ----------------------------------------------------------------
     # rearrange B when there is at least one Collection with more than one source
     if num_of_src_list > num_of_sources:
-        for src_ind, src in enumerate(sources):
-            if isinstance(src, Collection):
-                col_len = len(format_obj_input(src, allow="sources"))
-                # set B[i] to sum of slice
-                B[src_ind] = np.sum(B[src_ind : src_ind + col_len], axis=0)
-                B = np.delete(
-                    B, np.s_[src_ind + 1 : src_ind + col_len], 0
-                )  # delete remaining part of slice
+        # sum over the contiguous slices of each collection in a single pass
+        src_lens = [
+            len(format_obj_input(src, allow="sources"))
+            if isinstance(src, Collection)
+            else 1
+            for src in sources
+        ]
+        src_starts = np.cumsum([0] + src_lens[:-1])
+        B = np.add.reduceat(B, src_starts, axis=0)
 
     # apply sensor rotations (after summation over collections to reduce rot.apply operations)
-    for sens_ind, sens in enumerate(sensors):  # cycle through all sensors
-        if not unrotated_sensors[sens_ind]:  # apply operations only to rotated sensors
-            # select part where rot is applied
-            Bpart = B[:, :, pix_inds[sens_ind] : pix_inds[sens_ind + 1]]
-            # change shape to (P,3) for rot package
-            Bpart_orig_shape = Bpart.shape
-            Bpart_flat = np.reshape(Bpart, (-1, 3))
-            # apply sensor rotation
-            if static_sensor_rot[sens_ind]:  # special case: same rotation along path
-                sens_orient = sens._orientation[0]
-            else:
-                sens_orient = R.from_quat(
-                    np.tile(  # tile for each source from list
-                        np.repeat(  # same orientation path index for all indices
-                            sens._orientation.as_quat(), pix_nums[sens_ind], axis=0
-                        ),
-                        (num_of_sources, 1),
-                    )
-                )
-            Bpart_flat_rot = sens_orient.inv().apply(Bpart_flat)
-            # overwrite Bpart in B
-            B[:, :, pix_inds[sens_ind] : pix_inds[sens_ind + 1]] = np.reshape(
-                Bpart_flat_rot, Bpart_orig_shape
-            )
+    #   cycle only through rotated sensors, nothing to do in the common unrotated case
+    rotated_sensor_inds = [i for i, unrot in enumerate(unrotated_sensors) if not unrot]
+    for sens_ind in rotated_sensor_inds:
+        sens = sensors[sens_ind]
+        # select part where rot is applied, shape (L,M,P,3)
+        Bpart = B[:, :, pix_inds[sens_ind] : pix_inds[sens_ind + 1]]
+        # apply inverse sensor rotation: R^T @ b is computed as b @ R
+        if static_sensor_rot[sens_ind]:  # special case: same rotation along path
+            Bpart_rot = Bpart @ sens._orientation[0].as_matrix()
+        else:
+            # one batched product with the M path rotation matrices instead
+            # of tiling a (L*M*P,4) quaternion array for a single apply call
+            rotm = R.from_quat(sens_paths[sens_ind][1]).as_matrix()
+            Bpart_rot = np.einsum("lmpj,mji->lmpi", Bpart, rotm)
+        # overwrite Bpart in B
+        B[:, :, pix_inds[sens_ind] : pix_inds[sens_ind + 1]] = Bpart_rot
 
     # rearrange sensor-pixel shape
     if pix_all_same:
@@ -396,11 +402,6 @@ def getBH_level2(
         Bagg = [np.expand_dims(pixel_agg_func(b, axis=2), axis=2) for b in Bsplit]
         B = np.concatenate(Bagg, axis=2)
 
-    # reset tiled objects
-    for obj, m0 in zip(reset_obj, reset_obj_m0):
-        obj._position = obj._position[:m0]
-        obj._orientation = obj._orientation[:m0]
-
     # sumup over sources
     if sumup:
         B = np.sum(B, axis=0, keepdims=True)
@@ -453,7 +454,8 @@ def getBH_dict_level2(
 
     Returns
     -------
-    field: ndarray, shape (N,3), field at obs_pos in mT or kA/m
+    field: ndarray, shape (N,3) or (N1,N2,...,3) for observer grids, field at obs_pos
+    in mT or kA/m
 
     Info
     ----
@@ -489,6 +491,12 @@ def getBH_dict_level2(
             " when using the direct interface."
         ) from err
 
+    # flatten observer grids of shape (N1,N2,...,3) for the vectorized computation,
+    #   the grid shape is restored at the end
+    obs_shape = np.shape(observers)
+    if len(obs_shape) > 2:
+        observers = np.reshape(observers, (-1, obs_shape[-1]))
+
     kwargs["observers"] = observers
     kwargs["position"] = position
 
@@ -509,7 +517,7 @@ def getBH_dict_level2(
                 val = np.array([np.array(v, dtype=float) for v in val], dtype="object")
             else:
                 ragged_seq[key] = False
-                val = np.array(val, dtype=float)
+                val = np.asarray(val, dtype=float)
         except TypeError as err:
             raise MagpylibBadUserInput(
                 f"{key} input must be array-like.\n" f"Instead received {val}"
@@ -541,6 +549,16 @@ def getBH_dict_level2(
     # compute and return B
     B = getBH_level1(field=field, field_func=field_func, **kwargs)
 
+    if B is not None and len(obs_shape) > 2:
+        if vec_len != np.prod(obs_shape[:-1]):
+            raise MagpylibBadUserInput(
+                f"Input parameter `observers` with grid shape {obs_shape} is only "
+                "supported when all other input arrays are of length 1 or of the number "
+                f"of grid positions ({np.prod(obs_shape[:-1])}).\n"
+                f"Instead received lengths {vec_lengths}."
+            )
+        B = B.reshape(*obs_shape[:-1], 3)
+
     if B is not None and squeeze:
         return np.squeeze(B)
     return B
@@ -577,8 +595,9 @@ def getB(
         of such sensor objects (must all have similar pixel shapes). All positions
         are given in units of mm.
 
-        Direct interface: Input must be array_like with shape (3,) or (n,3) corresponding
-        positions to observer positions in units of mm.
+        Direct interface: Input must be array_like with shape (3,), (n,3) or
+        (n1, n2, ..., 3) corresponding to observer positions in units of mm. A grid of
+        shape (n1, n2, ..., 3) is flattened to n=n1*n2*... positions for the computation.
 
     sumup: bool, default=`False`
         If `True`, the fields of all sources are summed up.
@@ -648,8 +667,9 @@ def getB(
         to simple observer positions. Paths of objects that are shorter than m will be
         considered as static beyond their end.
 
-    Direct interface: ndarray, shape (n,3)
-        B-field for every parameter set in units of mT.
+    Direct interface: ndarray, shape (n,3) or (n1, n2, ..., 3)
+        B-field for every parameter set in units of mT. If the observers are given
+        as a grid of shape (n1, n2, ..., 3), the output has the same grid shape.
 
     Notes
     -----
@@ -748,8 +768,9 @@ def getH(
         of such sensor objects (must all have similar pixel shapes). All positions
         are given in units of mm.
 
-        Direct interface: Input must be array_like with shape (3,) or (n,3) corresponding
-        positions to observer positions in units of mm.
+        Direct interface: Input must be array_like with shape (3,), (n,3) or
+        (n1, n2, ..., 3) corresponding to observer positions in units of mm. A grid of
+        shape (n1, n2, ..., 3) is flattened to n=n1*n2*... positions for the computation.
 
     sumup: bool, default=`False`
         If `True`, the fields of all sources are summed up.
@@ -819,8 +840,9 @@ def getH(
         to simple observer positions. Paths of objects that are shorter than m will be
         considered as static beyond their end.
 
-    Direct interface: ndarray, shape (n,3)
-        H-field for every parameter set in units of kA/m.
+    Direct interface: ndarray, shape (n,3) or (n1, n2, ..., 3)
+        H-field for every parameter set in units of kA/m. If the observers are given
+        as a grid of shape (n1, n2, ..., 3), the output has the same grid shape.
 
     Notes
     -----
@@ -9,7 +9,7 @@ from scipy.spatial.transform import Rotation
 
 from magpylib import _src
 from magpylib._src.defaults.defaults_classes import default_settings
-from magpylib._src.defaults.defaults_utility import SUPPORTED_PLOTTING_BACKENDS
+from magpylib._src.defaults.defaults_utility import ALLOWED_BACKENDS
 from magpylib._src.exceptions import MagpylibBadUserInput
 from magpylib._src.exceptions import MagpylibMissingInput
 from magpylib._src.utility import format_obj_input
@@ -26,43 +26,55 @@ def all_same(lst: list) -> bool:
     return lst[1:] == lst[:-1]
 
 
-def is_array_like(inp, msg: str):
+def get_msg(msg) -> str:
+    """return error msg, msg can be a str or a callable returning a str, which allows
+    formatting the message only on failure"""
+    return msg() if callable(msg) else msg
+
+
+def is_array_like(inp, msg):
     """test if inp is array_like: type list, tuple or ndarray
     inp: test object
-    msg: str, error msg
+    msg: str or callable returning str, error msg
     """
     if not isinstance(inp, (list, tuple, np.ndarray)):
-        raise MagpylibBadUserInput(msg)
+        raise MagpylibBadUserInput(get_msg(msg))
 
 
-def make_float_array(inp, msg: str):
+def make_float_array(inp, msg):
     """transform inp to array with dtype=float, throw error with bad input
     inp: test object
-    msg: str, error msg
+    msg: str or callable returning str, error msg
     """
     try:
         inp_array = np.array(inp, dtype=float)
     except Exception as err:
-        raise MagpylibBadUserInput(msg + f"{err}") from err
+        raise MagpylibBadUserInput(get_msg(msg) + f"{err}") from err
     return inp_array
 
 
-def check_array_shape(inp: np.ndarray, dims: tuple, shape_m1: int, length=None, msg=""):
-    """check if inp shape is allowed
+def has_allowed_shape(inp: np.ndarray, dims: tuple, shape_m1: int, length=None):
+    """return True if inp shape is allowed
     inp: test object
     dims: list, list of allowed dims
     shape_m1: shape of lowest level, if 'any' allow any shape
-    msg: str, error msg
     """
     if inp.ndim in dims:
         if length is None:
-            if inp.shape[-1] == shape_m1:
-                return None
-            if shape_m1 == "any":
-                return None
-        elif len(inp) == length:
-            return None
-    raise MagpylibBadUserInput(msg)
+            return shape_m1 in ("any", inp.shape[-1])
+        return len(inp) == length
+    return False
+
+
+def check_array_shape(inp: np.ndarray, dims: tuple, shape_m1: int, length=None, msg=""):
+    """check if inp shape is allowed
+    inp: test object
+    dims: list, list of allowed dims
+    shape_m1: shape of lowest level, if 'any' allow any shape
+    msg: str or callable returning str, error msg
+    """
+    if not has_allowed_shape(inp, dims, shape_m1, length):
+        raise MagpylibBadUserInput(get_msg(msg))
 
 
 def check_input_zoom(inp):
@@ -330,21 +342,28 @@ def check_format_input_vector(
         if inp is None:
             return None
 
+    # error messages are only formatted on failure, this function is called for
+    #   every object construction and every position/orientation setter call
     is_array_like(
         inp,
-        f"Input parameter `{sig_name}` must be {sig_type}.\n"
-        f"Instead received type {type(inp)}.",
+        lambda: (
+            f"Input parameter `{sig_name}` must be {sig_type}.\n"
+            f"Instead received type {type(inp)}."
+        ),
     )
     inp = make_float_array(
         inp,
-        f"Input parameter `{sig_name}` must contain only float compatible entries.\n",
+        lambda: (
+            f"Input parameter `{sig_name}` must contain only float compatible "
+            "entries.\n"
+        ),
     )
     check_array_shape(
         inp,
         dims=dims,
         shape_m1=shape_m1,
         length=length,
-        msg=(
+        msg=lambda: (
             f"Input parameter `{sig_name}` must be {sig_type}.\n"
             f"Instead received array_like with shape {inp.shape}."
         ),
@@ -445,13 +464,12 @@ def check_format_input_cylinder_segment(inp):
 
 def check_format_input_backend(inp):
     """checks show-backend input and returns Non if bad input value"""
-    backends = [*SUPPORTED_PLOTTING_BACKENDS, "auto"]
     if inp is None:
         inp = default_settings.display.backend
-    if inp in backends:
+    if inp in ALLOWED_BACKENDS:
         return inp
     raise MagpylibBadUserInput(
-        f"Input parameter `backend` must be one of `{backends+[None]}`.\n"
+        f"Input parameter `backend` must be one of `{[*ALLOWED_BACKENDS, None]}`.\n"
         f"Instead received {inp}."
     )
 
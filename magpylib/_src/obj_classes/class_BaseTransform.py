@@ -125,30 +125,8 @@ def path_padding(inpath, start, target_object):
     return ppath, opath, start, end, bool(padding)
 
 
-def apply_move(target_object, displacement, start="auto"):
-    """Implementation of the move() functionality.
-
-    Parameters
-    ----------
-    target_object: object with position and orientation attributes
-    displacement: displacement vector/path, array_like, shape (3,) or (n,3).
-        If the input is scalar (shape (3,)) the operation is applied to the
-        whole path. If the input is a vector (shape (n,3)), it is
-        appended/merged with the existing path.
-    start: int, str, default=`'auto'`
-        start=i applies an operation starting at the i'th path index.
-        With start='auto' and scalar input the whole path is moved. With
-        start='auto' and vector input the input is appended.
-
-    Returns
-    -------
-    target_object
-    """
-    # pylint: disable=protected-access
-    # pylint: disable=attribute-defined-outside-init
-    # pylint: disable=too-many-branches
-
-    # check and format inputs
+def format_move_input(displacement, start):
+    """check and format move() inputs, return displacement as ndarray"""
     inpath = check_format_input_vector(
         displacement,
         dims=(1, 2),
@@ -157,6 +135,14 @@ def apply_move(target_object, displacement, start="auto"):
         sig_type="array_like (list, tuple, ndarray) with shape (3,) or (n,3)",
     )
     check_start_type(start)
+    return inpath
+
+
+def move_path(target_object, inpath, start="auto"):
+    """Apply an already formatted displacement `inpath` (see `apply_move`) to the path of
+    target_object."""
+    # pylint: disable=protected-access
+    # pylint: disable=attribute-defined-outside-init
 
     # pad target_object path and compute start and end-index for rotation application
     ppath, opath, start, end, padded = path_padding(inpath, start, target_object)
@@ -170,34 +156,32 @@ def apply_move(target_object, displacement, start="auto"):
     return target_object
 
 
-def apply_rotation(
-    target_object, rotation: R, anchor=None, start="auto", parent_path=None
-):
-    """Implementation of the rotate() functionality.
+def apply_move(target_object, displacement, start="auto"):
+    """Implementation of the move() functionality.
 
     Parameters
     ----------
     target_object: object with position and orientation attributes
-    rotation: a scipy Rotation object
+    displacement: displacement vector/path, array_like, shape (3,) or (n,3).
         If the input is scalar (shape (3,)) the operation is applied to the
         whole path. If the input is a vector (shape (n,3)), it is
         appended/merged with the existing path.
-    anchor: array_like shape (3,)
-        Rotation anchor
     start: int, str, default=`'auto'`
         start=i applies an operation starting at the i'th path index.
-        With start='auto' and scalar input the wole path is moved. With
+        With start='auto' and scalar input the whole path is moved. With
         start='auto' and vector input the input is appended.
-    parent_path=None if there is no parent else parent._position
 
     Returns
     -------
     target_object
     """
-    # pylint: disable=protected-access
-    # pylint: disable=too-many-branches
+    inpath = format_move_input(displacement, start)
+    return move_path(target_object, inpath, start=start)
+
 
-    # check and format inputs
+def format_rotation_input(rotation, anchor, start):
+    """check and format rotate() inputs, return rotation, rotation as quaternions and anchor
+    with the multi-anchor behavior applied"""
     rotation, inrotQ = check_format_input_orientation(rotation)
     anchor = check_format_input_anchor(anchor)
     check_start_type(start)
@@ -206,6 +190,15 @@ def apply_rotation(
     if anchor is not None:
         # apply multi-anchor behavior
         anchor, inrotQ, rotation = multi_anchor_behavior(anchor, inrotQ, rotation)
+    return rotation, inrotQ, anchor
+
+
+def rotate_path(
+    target_object, rotation: R, inrotQ, *, anchor=None, start="auto", parent_path=None
+):
+    """Apply an already formatted rotation (see `apply_rotation` and
+    `format_rotation_input`) to the path of target_object."""
+    # pylint: disable=protected-access
 
     # pad target_object path and compute start and end-index for rotation application
     ppath, opath, newstart, end, _ = path_padding(inrotQ, start, target_object)
@@ -244,6 +237,41 @@ def apply_rotation(
     return target_object
 
 
+def apply_rotation(
+    target_object, rotation: R, anchor=None, start="auto", parent_path=None
+):
+    """Implementation of the rotate() functionality.
+
+    Parameters
+    ----------
+    target_object: object with position and orientation attributes
+    rotation: a scipy Rotation object
+        If the input is scalar (shape (3,)) the operation is applied to the
+        whole path. If the input is a vector (shape (n,3)), it is
+        appended/merged with the existing path.
+    anchor: array_like shape (3,)
+        Rotation anchor
+    start: int, str, default=`'auto'`
+        start=i applies an operation starting at the i'th path index.
+        With start='auto' and scalar input the wole path is moved. With
+        start='auto' and vector input the input is appended.
+    parent_path=None if there is no parent else parent._position
+
+    Returns
+    -------
+    target_object
+    """
+    rotation, inrotQ, anchor = format_rotation_input(rotation, anchor, start)
+    return rotate_path(
+        target_object,
+        rotation,
+        inrotQ,
+        anchor=anchor,
+        start=start,
+        parent_path=parent_path,
+    )
+
+
 class BaseTransform:
     """Inherit this class to provide rotation() and move() methods."""
 
@@ -316,18 +344,30 @@ class BaseTransform:
          [5. 5. 7.]]
         """
 
+        # inputs are checked and formatted once for the whole collection tree
+        inpath = format_move_input(displacement, start)
+        return self._move(inpath, start=start)
+
+    def _move(self, inpath, start="auto"):
+        """Move object by an already formatted displacement.
+
+        See `move` docstring for other parameters.
+        """
         # Idea: An operation applied to a Collection is individually
         #    applied to its BaseGeo and to each child.
 
         for child in getattr(self, "children", []):
-            child.move(displacement, start=start)
+            child._move(inpath, start=start)
 
-        apply_move(self, displacement, start=start)
+        move_path(self, inpath, start=start)
 
         return self
 
-    def _rotate(self, rotation: R, anchor=None, start="auto", parent_path=None):
-        """Rotate object about a given anchor.
+    def _rotate(
+        self, rotation: R, inrotQ, *, anchor=None, start="auto", parent_path=None
+    ):
+        """Rotate object about a given anchor, with inputs already formatted by
+        `format_rotation_input`.
 
         See `rotate` docstring for other parameters.
 
@@ -345,10 +385,12 @@ class BaseTransform:
         # pylint: disable=no-member
         for child in getattr(self, "children", []):
             ppth = self._position if parent_path is None else parent_path
-            child._rotate(rotation, anchor=anchor, start=start, parent_path=ppth)
+            child._rotate(
+                rotation, inrotQ, anchor=anchor, start=start, parent_path=ppth
+            )
 
-        apply_rotation(
-            self, rotation, anchor=anchor, start=start, parent_path=parent_path
+        rotate_path(
+            self, rotation, inrotQ, anchor=anchor, start=start, parent_path=parent_path
         )
         return self
 
@@ -433,7 +475,9 @@ class BaseTransform:
          [  0.   0. 135.]]
         """
 
-        return self._rotate(rotation=rotation, anchor=anchor, start=start)
+        # inputs are checked and formatted once for the whole collection tree
+        rotation, inrotQ, anchor = format_rotation_input(rotation, anchor, start)
+        return self._rotate(rotation, inrotQ, anchor=anchor, start=start)
 
     def rotate_from_angax(self, angle, axis, anchor=None, start="auto", degrees=True):
         """Rotates object using angle-axis input.
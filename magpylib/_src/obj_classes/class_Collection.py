@@ -144,6 +144,7 @@ class BaseCollection(BaseDisplayRepr):
         for child in self._children:
             child._parent = None
         self._children = []
+        self._update_src_and_sens()
         self.add(*children, override_parent=True)
 
     @property
@@ -161,12 +162,14 @@ class BaseCollection(BaseDisplayRepr):
         """Set Collection sources."""
         # pylint: disable=protected-access
         new_children = []
+        old_ids = {id(obj) for obj in self._sources}
         for child in self._children:
-            if child in self._sources:
+            if id(child) in old_ids:
                 child._parent = None
             else:
                 new_children.append(child)
         self._children = new_children
+        self._update_src_and_sens()
         src_list = format_obj_input(sources, allow="sources")
         self.add(*src_list, override_parent=True)
 
@@ -185,12 +188,14 @@ class BaseCollection(BaseDisplayRepr):
         """Set Collection sensors."""
         # pylint: disable=protected-access
         new_children = []
+        old_ids = {id(obj) for obj in self._sensors}
         for child in self._children:
-            if child in self._sensors:
+            if id(child) in old_ids:
                 child._parent = None
             else:
                 new_children.append(child)
         self._children = new_children
+        self._update_src_and_sens()
         sens_list = format_obj_input(sensors, allow="sensors")
         self.add(*sens_list, override_parent=True)
 
@@ -209,12 +214,14 @@ class BaseCollection(BaseDisplayRepr):
         """Set Collection collections."""
         # pylint: disable=protected-access
         new_children = []
+        old_ids = {id(obj) for obj in self._collections}
         for child in self._children:
-            if child in self._collections:
+            if id(child) in old_ids:
                 child._parent = None
             else:
                 new_children.append(child)
         self._children = new_children
+        self._update_src_and_sens()
         coll_list = format_obj_input(collections, allow="collections")
         self.add(*coll_list, override_parent=True)
 
@@ -225,7 +232,7 @@ class BaseCollection(BaseDisplayRepr):
 
     # dunders
     def __iter__(self):
-        yield from self._children
+        return iter(self._children)
 
     def __getitem__(self, i):
         return self._children[i]
@@ -328,7 +335,11 @@ class BaseCollection(BaseDisplayRepr):
         for obj in obj_list:
             if isinstance(obj, Collection):
                 # no need to check recursively with `collections_all` if obj is already self
-                if obj is self or self in obj.collections_all:
+                # or if self has no parent, since it then cannot be part of another tree
+                # pylint: disable=no-member
+                if obj is self or (
+                    self._parent is not None and self in obj.collections_all
+                ):
                     raise MagpylibBadUserInput(
                         f"Cannot add {obj!r} because a Collection must not reference itself."
                     )
@@ -345,20 +356,31 @@ class BaseCollection(BaseDisplayRepr):
 
         # set attributes
         self._children += obj_list
-        self._update_src_and_sens()
+        self._update_src_and_sens(obj_list)
 
         return self
 
-    def _update_src_and_sens(self):
-        """updates sources, sensors and collections attributes from children"""
+    def _update_src_and_sens(self, new_children=None):
+        """updates sources, sensors and collections attributes from children. If
+        `new_children` is given, only these are sorted in (they must be the last children)
+        instead of going again through all children."""
         # pylint: disable=protected-access
         from magpylib._src.obj_classes.class_BaseExcitations import BaseSource
         from magpylib._src.obj_classes.class_Sensor import Sensor
 
-        self._sources = [obj for obj in self._children if isinstance(obj, BaseSource)]
-        self._sensors = [obj for obj in self._children if isinstance(obj, Sensor)]
-        self._collections = [
-            obj for obj in self._children if isinstance(obj, Collection)
+        if new_children is None:
+            self._sources, self._sensors, self._collections = [], [], []
+            new_children = self._children
+        # rebind instead of extending in place, lists returned by the getters must not
+        # change when children are added later on
+        self._sources = self._sources + [
+            obj for obj in new_children if isinstance(obj, BaseSource)
+        ]
+        self._sensors = self._sensors + [
+            obj for obj in new_children if isinstance(obj, Sensor)
+        ]
+        self._collections = self._collections + [
+            obj for obj in new_children if isinstance(obj, Collection)
         ]
 
     def remove(self, *children, recursive=True, errors="raise"):
@@ -101,20 +101,23 @@ class Sensor(BaseGeo, BaseDisplayRepr):
         """Sensor pixel (=sensing elements) positions in the local object coordinates
         (rotate with object), in units of mm.
         """
-        return self._pixel
+        return self._pixel_flat.reshape(self._pixel_shape)
 
     @pixel.setter
     def pixel(self, pix):
         """Set sensor pixel positions in the local sensor coordinates.
         Must be an array_like, float compatible with shape (..., 3)
         """
-        self._pixel = check_format_input_vector(
+        pix = check_format_input_vector(
             pix,
             dims=range(1, 20),
             shape_m1=3,
             sig_name="pixel",
             sig_type="array_like (list, tuple, ndarray) with shape (n1, n2, ..., 3)",
         )
+        # pixel are stored flat with shape (n,3) as required for field computation
+        self._pixel_shape = pix.shape
+        self._pixel_flat = pix.reshape(-1, 3)
 
     def getB(
         self, *sources, sumup=False, squeeze=True, pixel_agg=None, output="ndarray"
@@ -269,7 +272,7 @@ class Sensor(BaseGeo, BaseDisplayRepr):
     @property
     def _default_style_description(self):
         """Default style description text"""
-        pixel = np.array(self.pixel).reshape((-1, 3))
+        pixel = self._pixel_flat
         pix_uniq = np.unique(pixel, axis=0)
         one_pix = pix_uniq.shape[0] == 1 and not (pix_uniq == 0).all()
         return (
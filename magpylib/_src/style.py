@@ -2,6 +2,8 @@
 # pylint: disable=C0302
 # pylint: disable=too-many-instance-attributes
 # pylint: disable=cyclic-import
+from functools import lru_cache
+
 import numpy as np
 
 from magpylib._src.defaults.defaults_utility import ALLOWED_LINESTYLES
@@ -15,9 +17,18 @@ from magpylib._src.defaults.defaults_utility import validate_style_keys
 
 ALLOWED_SIZEMODES = ("scaled", "absolute")
 
+ALLOWED_TRACE_BACKENDS = ("generic", *SUPPORTED_PLOTTING_BACKENDS)
+
 
 def get_families(obj):
     """get obj families"""
+    return list(get_families_from_type(type(obj)))
+
+
+@lru_cache(maxsize=None)
+def get_families_from_type(obj_type):
+    """get families of an object type. Results are cached per type since the family of an
+    object only depends on its class"""
     # pylint: disable=import-outside-toplevel
     # pylint: disable=possibly-unused-variable
     # pylint: disable=redefined-outer-name
@@ -37,38 +48,22 @@ def get_families(obj):
     from magpylib._src.obj_classes.class_Sensor import Sensor
     from magpylib._src.display.traces_generic import MagpyMarkers as Markers
 
-    loc = locals()
+    loc = {k: v for k, v in locals().items() if k != "obj_type"}
     obj_families = []
     for item, val in loc.items():
         if not item.startswith("_"):
             try:
-                if isinstance(obj, val):
+                if issubclass(obj_type, val):
                     obj_families.append(item.lower())
             except TypeError:
                 pass
-    return obj_families
+    return tuple(obj_families)
 
 
-def get_style(obj, default_settings, **kwargs):
-    """Returns default style based on increasing priority:
-    - style from defaults
-    - style from object
-    - style from kwargs arguments
-    """
-    obj_families = get_families(obj)
-    # parse kwargs into style an non-style arguments
-    style_kwargs = kwargs.get("style", {})
-    style_kwargs.update(
-        {k[6:]: v for k, v in kwargs.items() if k.startswith("style") and k != "style"}
-    )
-
-    # retrieve default style dictionary, local import to avoid circular import
-    # pylint: disable=import-outside-toplevel
-
-    default_style = default_settings.display.style
+def get_default_style_flat(obj_families, default_style):
+    """Returns the flat default style dictionary of an object with given families, based on
+    the base default style updated with the non-`None` values of each family style."""
     base_style_flat = default_style.base.as_dict(flatten=True, separator="_")
-
-    # construct object specific dictionary base on style family and default style
     for obj_family in obj_families:
         family_style = getattr(default_style, obj_family, {})
         if family_style:
@@ -76,15 +71,60 @@ def get_style(obj, default_settings, **kwargs):
             base_style_flat.update(
                 {k: v for k, v in family_dict.items() if v is not None}
             )
-    style_kwargs = validate_style_keys(style_kwargs)
+    return base_style_flat
+
+
+def get_style(obj, default_settings, defaults_cache=None, **kwargs):
+    """Returns default style based on increasing priority:
+    - style from defaults
+    - style from object
+    - style from kwargs arguments
+
+    If a `defaults_cache` dictionary is provided, the flat default style dictionaries get
+    stored in it by object type, so that the default style only gets flattened once per
+    object type when calling this function repeatedly with unchanged `default_settings`.
+    """
+    # parse kwargs into style an non-style arguments
+    style_kwargs = {}
+    if kwargs:
+        style_kwargs.update(kwargs.get("style", {}))
+        style_kwargs.update(
+            {
+                k[6:]: v
+                for k, v in kwargs.items()
+                if k.startswith("style") and k != "style"
+            }
+        )
+
+    # construct object specific dictionary base on style family and default style
+    obj_type = type(obj)
+    if defaults_cache is not None and obj_type in defaults_cache:
+        base_style_flat = defaults_cache[obj_type]
+    else:
+        base_style_flat = get_default_style_flat(
+            get_families(obj), default_settings.display.style
+        )
+        if defaults_cache is not None:
+            defaults_cache[obj_type] = base_style_flat
 
     # create style class instance and update based on precedence
+    # pylint: disable=protected-access
     style = obj.style.copy()
-    style_kwargs_specific = {
-        k: v for k, v in style_kwargs.items() if k.split("_")[0] in style.as_dict()
-    }
-    style.update(**style_kwargs_specific, _match_properties=True)
-    style.update(**base_style_flat, _match_properties=False, _replace_None_only=True)
+    if style_kwargs:
+        style_kwargs = validate_style_keys(style_kwargs)
+        style_kwargs_specific = {
+            k: v
+            for k, v in style_kwargs.items()
+            if k.split("_")[0] in style._property_names
+        }
+        style.update(**style_kwargs_specific, _match_properties=True)
+    # default styles are already validated, their values can be stored directly
+    style.update(
+        **base_style_flat,
+        _match_properties=False,
+        _replace_None_only=True,
+        _skip_validation=True,
+    )
 
     return style
 
@@ -242,7 +282,7 @@ class BaseStyle(MagicProperties):
 
     @color.setter
     def color(self, val):
-        self._color = color_validator(val, parent_name=f"{type(self).__name__}")
+        self._color = color_validator(val, parent_name=type(self).__name__)
 
     @property
     def opacity(self):
@@ -620,10 +660,9 @@ class Trace3d(MagicProperties):
 
     @backend.setter
     def backend(self, val):
-        backends = ["generic"] + list(SUPPORTED_PLOTTING_BACKENDS)
-        assert val is None or val in backends, (
+        assert val is None or val in ALLOWED_TRACE_BACKENDS, (
             f"The `backend` property of {type(self).__name__} must be one of"
-            f"{backends},\n"
+            f"{ALLOWED_TRACE_BACKENDS},\n"
             f"but received {repr(val)} instead."
         )
         self._backend = val
@@ -920,9 +959,6 @@ class MagnetStyle(BaseStyle, MagnetProperties):
         or a dictionary with equivalent key/value pairs.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
 
 class MarkerLineProperties:
     """Defines styling properties of Markers and Lines."""
@@ -1044,8 +1080,7 @@ class DisconnectedMesh(MagicProperties, MarkerLineProperties):
             name = type(self).__name__
             try:
                 val = tuple(
-                    color_validator(c, allow_None=False, parent_name=f"{name}")
-                    for c in val
+                    color_validator(c, allow_None=False, parent_name=name) for c in val
                 )
             except TypeError as err:
                 raise ValueError(
@@ -1199,7 +1234,7 @@ class Orientation(MagicProperties):
 
     @color.setter
     def color(self, val):
-        self._color = color_validator(val, parent_name=f"{type(self).__name__}")
+        self._color = color_validator(val, parent_name=type(self).__name__)
 
     @property
     def offset(self):
@@ -1484,7 +1519,7 @@ class ArrowSingle(MagicProperties):
 
     @color.setter
     def color(self, val):
-        self._color = color_validator(val, parent_name=f"{type(self).__name__}")
+        self._color = color_validator(val, parent_name=type(self).__name__)
 
 
 class SensorProperties:
@@ -1624,9 +1659,6 @@ class SensorStyle(BaseStyle, SensorProperties):
         `ArrowCS` object or dict with equivalent key/value pairs (e.g. `color`, `size`).
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
 
 class Pixel(MagicProperties):
     """Defines the styling properties of sensor pixels.
@@ -1694,7 +1726,7 @@ class Pixel(MagicProperties):
 
     @color.setter
     def color(self, val):
-        self._color = color_validator(val, parent_name=f"{type(self).__name__}")
+        self._color = color_validator(val, parent_name=type(self).__name__)
 
     @property
     def symbol(self):
@@ -1786,9 +1818,6 @@ class CurrentStyle(BaseStyle, CurrentProperties):
         `Arrow` object or dict with `'show'`, `'size'` properties/keys.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
 
 class Arrow(Line):
     """Defines styling properties of current arrows.
@@ -2109,9 +2138,6 @@ class DipoleStyle(BaseStyle, DipoleProperties):
         The arrow rotates about this point. Can be one of `['tail', 'middle', 'tip']`.
     """
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-
 
 class Path(MagicProperties, MarkerLineProperties):
     """Defines styling properties of an object's path.
@@ -133,22 +133,6 @@ def format_src_inputs(sources) -> list:
     return list(sources), src_list
 
 
-def check_static_sensor_orient(sensors):
-    """test which sensors have a static orientation"""
-    # pylint: disable=protected-access
-    static_sensor_rot = []
-    for sens in sensors:
-        if len(sens._position) == 1:  # no sensor path (sensor is static)
-            static_sensor_rot += [True]
-        else:  # there is a sensor path
-            rot = sens.orientation.as_quat()
-            if np.all(rot == rot[0]):  # path with static orient (e.g. translation)
-                static_sensor_rot += [True]
-            else:  # sensor rotation changes along path
-                static_sensor_rot += [False]
-    return static_sensor_rot
-
-
 def check_duplicates(obj_list: Sequence) -> list:
     """checks for and eliminates source duplicates in a list of sources
     ### Args:
@@ -157,8 +141,10 @@ def check_duplicates(obj_list: Sequence) -> list:
     - list: obj_list with duplicates removed
     """
     obj_list_new = []
+    seen_ids = set()
     for src in obj_list:
-        if src not in obj_list_new:
+        if id(src) not in seen_ids:
+            seen_ids.add(id(src))
             obj_list_new += [src]
 
     if len(obj_list_new) != len(obj_list):
@@ -108,6 +108,7 @@ def test_linearize_dict():
         ("rgb(127, 127, 127)", True, "#7f7f7f"),
         ((0, 0, 0, 0), False, "#000000"),
         ((0.1, 0.2, 0.3), False, "#19334c"),
+        ([0.1, 0.2, 0.3], False, "#19334c"),
     ]
     + [(shortC, True, longC) for shortC, longC in COLORS_SHORT_TO_LONG.items()],
 )
@@ -208,6 +209,18 @@ def test_MagicProperties():
         flatten=True
     ), "failed copying, should return the same property values"
 
+    # check copy of nested properties is independent
+    bp4 = BPsub1(prop1=BPsub2(prop2=10))
+    bp5 = bp4.copy()
+    bp5.prop1.prop2 = 30
+    assert bp4.prop1.prop2 == 10, "failed copying, sub-properties should be copied"
+
+    # check update bypassing validation
+    bp5.update(prop1_prop2=40, _skip_validation=True)
+    assert bp5.as_dict() == {"prop1": {"prop2": 40}}, "unchecked update failed"
+    assert isinstance(bp5.prop1, BPsub2), "unchecked update should keep sub-properties"
+    assert bp4.prop1.prop2 == 10, "unchecked update should not affect the original"
+
     # check failing init
     with pytest.raises(AttributeError):
         BPsub1(a=0)  # `a` is not a property in the class
@@ -117,6 +117,13 @@ def test_Sensor_display():
     )
 
 
+def test_markers_ndarray_display():
+    """testing display with markers given as numpy array"""
+    ax = plt.subplot(projection="3d")
+    sens = magpy.Sensor()
+    sens.show(canvas=ax, markers=np.array([(1, 2, 3), (2, 3, 4)]), return_fig=True)
+
+
 def test_CustomSource_display():
     """testing display"""
     ax = plt.subplot(projection="3d")
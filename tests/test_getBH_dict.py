@@ -413,3 +413,31 @@ def test_subclassing():
     )
 
     np.testing.assert_allclose(B1, B2)
+
+
+def test_getB_dict_observer_grid():
+    """test that observer grids of shape (n1,n2,...,3) are accepted and retain
+    their shape in the direct interface"""
+    pos_obs = np.linspace((-1, -2, -3), (3, 2, 1), 24).reshape(2, 4, 3, 3)
+    src = Cuboid((100, 200, 300), (1, 2, 3), position=(0.1, 0.2, 0.3))
+    B1 = getB(
+        "Cuboid",
+        pos_obs,
+        magnetization=(100, 200, 300),
+        dimension=(1, 2, 3),
+        position=(0.1, 0.2, 0.3),
+    )
+    B2 = src.getB(pos_obs)
+
+    assert B1.shape == (2, 4, 3, 3)
+    np.testing.assert_allclose(B1, B2)
+
+    # grid shape cannot be restored when other inputs have a different length
+    with pytest.raises(MagpylibBadUserInput):
+        getB(
+            "Cuboid",
+            np.ones((1, 1, 3)),
+            magnetization=(100, 200, 300),
+            dimension=(1, 2, 3),
+            position=np.zeros((4, 3)),
+        )
@@ -490,3 +490,28 @@ def test_pixel_agg3():
                     rtol=1e-5,
                     atol=1e-8,
                 )
+
+
+def test_getBH_level2_static_objects_unchanged():
+    """test that objects with shorter paths are filled up for the computation
+    without modifying their paths"""
+    src1 = magpy.magnet.Cuboid((0, 0, 1000), (1, 1, 1))
+    src2 = magpy.magnet.Sphere((1000, 0, 0), 1, position=[(0, 0, 1)] * 3)
+    src2.rotate_from_angax([10, 20], "x")
+    sens = magpy.Sensor(
+        position=np.linspace((0, 0, 1), (0, 0, 5), 8), pixel=[(0, 0, 0), (1, 1, 1)]
+    )
+    sens.rotate_from_angax(np.linspace(0, 90, 8), "z", start=0)
+
+    B = magpy.getB([src1, src2], sens)
+
+    assert B.shape == (2, 8, 2, 3)
+    assert src1.position.shape == (3,)
+    assert src2.position.shape == (5, 3)
+    assert len(src2.orientation) == 5
+
+    # compare to explicitly filled up paths
+    src1.position = [(0, 0, 0)] * 8
+    src2.position = np.concatenate([src2.position, [src2.position[-1]] * 3])
+    src2.orientation = src2.orientation[[0, 1, 2, 3, 4, 4, 4, 4]]
+    np.testing.assert_allclose(B, magpy.getB([src1, src2], sens))
@@ -216,6 +216,13 @@ def test_collections_add():
     with np.testing.assert_raises(MagpylibBadUserInput):
         c2.add(magpy.Collection(c2))
 
+    # add a parent collection several levels up, should fail
+    c5 = magpy.Collection(style_label="c5")
+    c6 = magpy.Collection(c5, style_label="c6")
+    c7 = magpy.Collection(c6, style_label="c7")
+    with np.testing.assert_raises(MagpylibBadUserInput):
+        c5.add(c7)
+
 
 def test_collection_plus():
     """
@@ -349,3 +356,23 @@ def test_collection_properties_all():
     assert cc.sources_all == [s1, s2, s3, s4]
     assert cc.sensors_all == [x1, x2, x3]
     assert cc.collections_all == [c1, c2, c3]
+
+
+def test_collection_add_while_iterating():
+    """adding children must not alter previously returned sources/sensors lists"""
+    s1 = magpy.magnet.Cuboid()
+    s2 = magpy.magnet.Cuboid()
+    x1 = magpy.Sensor()
+    col = magpy.Collection(s1, s2, x1)
+
+    srcs, sens = col.sources, col.sensors
+    for src in col.sources:
+        col.add(src.copy())
+    for sen in col.sensors:
+        col.add(sen.copy())
+
+    assert srcs == [s1, s2]
+    assert sens == [x1]
+    assert len(col.sources) == 4
+    assert len(col.sensors) == 2
+    assert len(col.children) == 6
@@ -132,3 +132,17 @@ def test_pixel3():
             src.getB(Sensor(pixel=pos_vec), squeeze=False),
             src.getB(pos_vec, squeeze=False),
         )
+
+
+def test_pixel_inplace_modification():
+    """in-place modifications of the pixel array must be considered in field
+    computations, also for sensor copies"""
+    src = magpy.misc.Dipole((1, 2, 3))
+    sens = Sensor(pixel=[[(1, 2, 3), (2, 3, 4)]])
+    sens2 = sens.copy()
+    for s in [sens, sens2]:
+        s.pixel[0, 1] = (3, 4, 5)
+        assert s.pixel.shape == (1, 2, 3)
+        np.testing.assert_allclose(
+            s.getB(src), src.getB([[(1, 2, 3), (3, 4, 5)]]), rtol=1e-12
+        )